@@ -2,16 +2,68 @@
 """
 Generate sound effects for Calc3D calculator.
 
-Creates simple tone-based sound effects using numpy and scipy.
+Creates simple tone-based sound effects using numpy.
 Each sound has a distinct frequency and duration for different actions.
 """
 
+import argparse
 import struct
 import wave
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 
-def generate_tone_wave(frequency: float, duration: float, sample_rate: int = 44100, volume: float = 0.3) -> bytes:
+
+@lru_cache(maxsize=32)
+def _time_and_envelope(
+    num_samples: int, sample_rate: int, duration: float, fade: float = 0.01
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the time axis and fade envelope for a clip, cached per clip shape.
+
+    The arrays are shared between callers, so they are made read-only.
+
+    Args:
+        num_samples: Number of samples
+        sample_rate: Sample rate in Hz
+        duration: Duration in seconds
+        fade: Fade in/out duration in seconds
+
+    Returns:
+        Tuple of (sample times in seconds, envelope gains)
+    """
+    t = np.arange(num_samples) / sample_rate
+    envelope = np.clip(np.minimum(t, duration - t) / fade, 0.0, 1.0)
+    t.flags.writeable = False
+    envelope.flags.writeable = False
+    return t, envelope
+
+
+def make_envelope(
+    num_samples: int, sample_rate: int, duration: float, fade: float = 0.01
+) -> np.ndarray:
+    """
+    Build a linear fade in/out envelope to prevent clicking.
+
+    Args:
+        num_samples: Number of samples
+        sample_rate: Sample rate in Hz
+        duration: Duration in seconds
+        fade: Fade in/out duration in seconds
+
+    Returns:
+        Read-only array of envelope gains between 0.0 and 1.0
+    """
+    return _time_and_envelope(num_samples, sample_rate, duration, fade)[1]
+
+
+def generate_tone_wave(
+    frequency: float,
+    duration: float,
+    sample_rate: int = 44100,
+    volume: float = 0.3,
+) -> np.ndarray:
     """
     Generate a sine wave tone as raw audio data.
 
@@ -22,53 +74,57 @@ def generate_tone_wave(frequency: float, duration: float, sample_rate: int = 441
         volume: Volume level (0.0 to 1.0)
 
     Returns:
-        Raw audio data as bytes
+        Array of 16-bit audio samples
     """
-    import math
-
     num_samples = int(sample_rate * duration)
-    samples = []
 
-    for i in range(num_samples):
-        # Generate sine wave with envelope (fade in/out)
-        t = i / sample_rate
+    # Time axis and envelope (10ms fade in/out to prevent clicking)
+    t, envelope = _time_and_envelope(num_samples, sample_rate, duration)
 
-        # Apply envelope to prevent clicking
-        envelope = 1.0
-        fade_duration = 0.01  # 10ms fade in/out
-        if t < fade_duration:
-            envelope = t / fade_duration
-        elif t > duration - fade_duration:
-            envelope = (duration - t) / fade_duration
+    # Generate samples in one buffer (in-place ops) and convert to 16-bit integers
+    angular_frequency = 2 * np.pi * frequency
+    samples = np.multiply(t, angular_frequency)
+    np.sin(samples, out=samples)
+    samples *= volume * 32767
+    samples *= envelope
+    return samples.astype(np.int16)
 
-        # Generate sample
-        sample = math.sin(2 * math.pi * frequency * t) * volume * envelope
 
-        # Convert to 16-bit integer
-        sample_int = int(sample * 32767)
-        samples.append(sample_int)
+def write_wav_mono16(filename: Path, samples: np.ndarray, sample_rate: int = 44100):
+    """
+    Write little-endian 16-bit mono samples as a WAV file in one write.
+
+    The 44-byte RIFF header is built directly since the format and sample
+    count are known up front.
 
-    return samples
+    Args:
+        filename: Output file path
+        samples: Array of little-endian 16-bit samples
+        sample_rate: Sample rate in Hz
+    """
+    data = samples.tobytes()
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(data), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", len(data),
+    )
+    Path(filename).write_bytes(header + data)
 
 
-def save_wav(filename: Path, samples: list, sample_rate: int = 44100):
+def save_wav(filename: Path, samples: np.ndarray | list, sample_rate: int = 44100):
     """
     Save audio samples to a WAV file.
 
     Args:
         filename: Output file path
-        samples: List of audio samples (16-bit integers)
+        samples: Array or list of audio samples (16-bit integers)
         sample_rate: Sample rate in Hz
     """
-    with wave.open(str(filename), 'wb') as wav_file:
-        # Set WAV parameters: mono, 16-bit
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)  # 2 bytes = 16 bits
-        wav_file.setframerate(sample_rate)
-
-        # Write samples
-        for sample in samples:
-            wav_file.writeframes(struct.pack('<h', sample))
+    # Mono, 16-bit little-endian samples
+    if not (isinstance(samples, np.ndarray) and samples.dtype == np.dtype("<i2")):
+        samples = np.asarray(samples, dtype="<i2")
+    write_wav_mono16(filename, samples, sample_rate)
 
 
 def generate_beep(frequency: float, duration: float, output_file: Path):
@@ -95,37 +151,135 @@ def generate_chord(frequencies: list, duration: float, output_file: Path):
         output_file: Output file path
     """
     print(f"Generating {output_file.name}: chord {frequencies}, {duration}s")
-    import math
 
     sample_rate = 44100
     num_samples = int(sample_rate * duration)
-    samples = []
 
-    for i in range(num_samples):
-        t = i / sample_rate
+    # Time axis and envelope
+    t, envelope = _time_and_envelope(num_samples, sample_rate, duration)
+
+    # Mix all frequencies in place into one accumulator, reusing a scratch buffer
+    mixed = np.zeros(num_samples)
+    tone = np.empty(num_samples)
+    for freq in frequencies:
+        np.multiply(t, 2 * np.pi * freq, out=tone)
+        mixed += np.sin(tone, out=tone)
+
+    # Average, apply envelope, and saturate to the 16-bit range
+    mixed *= 0.3 * 32767 / max(len(frequencies), 1)
+    mixed *= envelope
+    np.clip(mixed, -32768, 32767, out=mixed)
+    save_wav(output_file, mixed.astype(np.int16))
+
+
+def generate_chirp(
+    start_frequency: float,
+    end_frequency: float,
+    duration: float,
+    output_file: Path,
+    sample_rate: int = 44100,
+    volume: float = 0.3,
+):
+    """
+    Generate a tone sweeping linearly from one frequency to another.
+
+    Args:
+        start_frequency: Starting frequency in Hz
+        end_frequency: Ending frequency in Hz
+        duration: Duration in seconds
+        output_file: Output file path
+        sample_rate: Sample rate in Hz
+        volume: Volume level (0.0 to 1.0)
+    """
+    direction = "rising" if end_frequency > start_frequency else "falling"
+    print(
+        f"Generating {output_file.name}: {direction} tone "
+        f"{start_frequency}-{end_frequency}Hz, {duration}s"
+    )
+
+    num_samples = int(sample_rate * duration)
+    t, envelope = _time_and_envelope(num_samples, sample_rate, duration)
+
+    # Integrate the linearly changing frequency to get the phase of a true sweep
+    sweep_rate = (end_frequency - start_frequency) / duration if duration else 0.0
+    phase = 2 * np.pi * (start_frequency * t + 0.5 * sweep_rate * t * t)
 
-        # Apply envelope
-        envelope = 1.0
-        fade_duration = 0.01
-        if t < fade_duration:
-            envelope = t / fade_duration
-        elif t > duration - fade_duration:
-            envelope = (duration - t) / fade_duration
+    samples = np.sin(phase) * volume * envelope
+    save_wav(output_file, (samples * 32767).astype(np.int16), sample_rate)
 
-        # Mix all frequencies
-        sample = 0
-        for freq in frequencies:
-            sample += math.sin(2 * math.pi * freq * t) / len(frequencies)
 
-        sample *= 0.3 * envelope
-        sample_int = int(sample * 32767)
-        samples.append(sample_int)
+# Each sound has a distinct character for different calculator actions
+
+
+def make_digit(output_file: Path, duration: float):
+    """Digit: Short, mid-frequency click (pleasant feedback)."""
+    generate_beep(800, duration, output_file)
+
+
+def make_operator(output_file: Path, duration: float):
+    """Operator: Lower tone, slightly longer (different from digit)."""
+    generate_beep(600, duration, output_file)
+
+
+def make_equals(output_file: Path, duration: float):
+    """Equals: Higher, rising tone (satisfying "completion" sound)."""
+    generate_chirp(600, 1200, duration, output_file)
+
+
+def make_clear(output_file: Path, duration: float):
+    """Clear: Falling tone (opposite of equals, "reset" feeling)."""
+    generate_chirp(1000, 400, duration, output_file)
 
-    save_wav(output_file, samples)
 
+def make_error(output_file: Path, duration: float):
+    """Error: Dissonant chord (unpleasant, attention-grabbing)."""
+    generate_chord([400, 450, 320], duration, output_file)
 
-def main():
+
+# (filename, duration in seconds, generator)
+SOUNDS = (
+    ("digit.wav", 0.05, make_digit),
+    ("operator.wav", 0.08, make_operator),
+    ("equals.wav", 0.15, make_equals),
+    ("clear.wav", 0.15, make_clear),
+    ("error.wav", 0.2, make_error),
+)
+
+
+def file_is_fresh(filepath: Path, duration: float, sample_rate: int = 44100) -> bool:
+    """
+    Check whether an existing WAV file already matches the expected spec.
+
+    Args:
+        filepath: Path to WAV file
+        duration: Expected duration in seconds
+        sample_rate: Expected sample rate in Hz
+
+    Returns:
+        True if the file exists with the expected format and length
+    """
+    if not filepath.exists():
+        return False
+    try:
+        with wave.open(str(filepath), "rb") as wav:
+            return (
+                wav.getnchannels() == 1
+                and wav.getsampwidth() == 2
+                and wav.getframerate() == sample_rate
+                and wav.getnframes() == int(sample_rate * duration)
+            )
+    except (wave.Error, EOFError):
+        return False
+
+
+def main(argv: list[str] | None = None):
     """Generate all calculator sound effects."""
+    parser = argparse.ArgumentParser(description="Generate Calc3D sound effects.")
+    parser.add_argument(
+        "--force", action="store_true", help="regenerate files even if they are up to date"
+    )
+    args = parser.parse_args(argv)
+
     # Get sounds directory
     sounds_dir = Path(__file__).parent / "src" / "calc3d" / "static" / "sounds"
     sounds_dir.mkdir(parents=True, exist_ok=True)
@@ -133,66 +287,17 @@ def main():
     print(f"Generating sound effects in {sounds_dir}")
     print("=" * 60)
 
-    # Define sound specifications
-    # Each sound has a distinct character for different calculator actions
-
-    # Digit: Short, mid-frequency click (pleasant feedback)
-    generate_beep(800, 0.05, sounds_dir / "digit.wav")
-
-    # Operator: Lower tone, slightly longer (different from digit)
-    generate_beep(600, 0.08, sounds_dir / "operator.wav")
-
-    # Equals: Higher, rising tone (satisfying "completion" sound)
-    # Create a rising tone effect
-    samples = []
-    sample_rate = 44100
-    duration = 0.15
-    num_samples = int(sample_rate * duration)
-
-    import math
-    for i in range(num_samples):
-        t = i / sample_rate
-        # Frequency rises from 600 to 1200 Hz
-        freq = 600 + (600 * (t / duration))
-
-        # Envelope
-        envelope = 1.0
-        fade_duration = 0.01
-        if t < fade_duration:
-            envelope = t / fade_duration
-        elif t > duration - fade_duration:
-            envelope = (duration - t) / fade_duration
-
-        sample = math.sin(2 * math.pi * freq * t) * 0.3 * envelope
-        sample_int = int(sample * 32767)
-        samples.append(sample_int)
-
-    print(f"Generating equals.wav: rising tone 600-1200Hz, {duration}s")
-    save_wav(sounds_dir / "equals.wav", samples)
-
-    # Clear: Falling tone (opposite of equals, "reset" feeling)
-    samples = []
-    for i in range(num_samples):
-        t = i / sample_rate
-        # Frequency falls from 1000 to 400 Hz
-        freq = 1000 - (600 * (t / duration))
-
-        # Envelope
-        envelope = 1.0
-        if t < fade_duration:
-            envelope = t / fade_duration
-        elif t > duration - fade_duration:
-            envelope = (duration - t) / fade_duration
-
-        sample = math.sin(2 * math.pi * freq * t) * 0.3 * envelope
-        sample_int = int(sample * 32767)
-        samples.append(sample_int)
-
-    print(f"Generating clear.wav: falling tone 1000-400Hz, {duration}s")
-    save_wav(sounds_dir / "clear.wav", samples)
-
-    # Error: Dissonant chord (unpleasant, attention-grabbing)
-    generate_chord([400, 450, 320], 0.2, sounds_dir / "error.wav")
+    pending = []
+    for filename, duration, make in SOUNDS:
+        output_file = sounds_dir / filename
+        if not args.force and file_is_fresh(output_file, duration):
+            print(f"Skipping {filename}: already up to date")
+        else:
+            pending.append((make, output_file, duration))
+
+    # Generate in-process: the clips take milliseconds and share cached envelopes
+    for make, output_file, duration in pending:
+        make(output_file, duration)
 
     print("=" * 60)
     print("✅ Sound generation complete!")
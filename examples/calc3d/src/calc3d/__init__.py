@@ -5,8 +5,13 @@ __version__ = "0.1.0"
 
 def main() -> None:
     """Entry point for the calc3d application."""
+    import os
+
     import uvicorn
 
+    # The dev server reloads code, so also pick up template edits
+    os.environ.setdefault("CALC3D_DEV", "1")
+
     print("Starting Calc3D server...")
     print("Open your browser at http://localhost:8000")
     uvicorn.run(
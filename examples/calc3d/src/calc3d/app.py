@@ -1,33 +1,58 @@
 """FastAPI application setup for Calc3D."""
 
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 # Get the package directory
 BASE_DIR = Path(__file__).resolve().parent
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Pre-render the static home page once at startup."""
+    # Jinja's default cache dir is per-user (0700) and ownership-checked
+    templates.env.bytecode_cache = FileSystemBytecodeCache()
+    app.state.index_html = render_index()
+    yield
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Calc3D",
     description="A beautiful 3D calculator web application",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Mount static files
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
-# Setup templates
+# Setup templates; reload from disk only in development
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+templates.env.auto_reload = os.environ.get("CALC3D_DEV") == "1"
+
+
+def render_index() -> str:
+    """Render the home page; it has no per-request data, only static asset URLs."""
+    return templates.get_template("index.html").render(url_for=app.url_path_for)
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    """Render the home page with the 3D calculator."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    """Serve the home page with the 3D calculator."""
+    index_html = getattr(request.app.state, "index_html", None)
+    if templates.env.auto_reload or index_html is None:
+        # Development reload, or the app is served without its lifespan
+        return HTMLResponse(render_index())
+    return HTMLResponse(index_html)
 
 
 @app.get("/health")
@@ -10,9 +10,18 @@ Checks that all sound files:
 """
 
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Audio format checks: (property, expected value, label)
+FORMAT_CHECKS = (
+    ('channels', 1, 'Mono'),
+    ('sample_width', 2, '16-bit'),
+    ('framerate', 44100, '44.1 kHz'),
+)
+
+
 def test_wav_file(filepath: Path) -> dict:
     """
     Test a WAV file and return its properties.
@@ -67,13 +76,20 @@ def main():
         'error.wav': {'min_duration': 0.19, 'max_duration': 0.21},
     }
 
+    # Read all files concurrently, then report sequentially
+    with ThreadPoolExecutor(max_workers=len(sound_files)) as executor:
+        results = dict(zip(
+            sound_files,
+            executor.map(test_wav_file, [sounds_dir / name for name in sound_files]),
+            strict=True,
+        ))
+
     all_valid = True
 
     for filename, expected in sound_files.items():
-        filepath = sounds_dir / filename
         print(f"Testing {filename}...")
 
-        props = test_wav_file(filepath)
+        props = results[filename]
 
         if not props.get('exists'):
             print(f"  ❌ File does not exist")
@@ -88,26 +104,12 @@ def main():
         # Check properties
         checks = []
 
-        # Mono audio
-        if props['channels'] == 1:
-            checks.append("✓ Mono")
-        else:
-            checks.append(f"✗ {props['channels']} channels (expected 1)")
-            all_valid = False
-
-        # 16-bit audio
-        if props['sample_width'] == 2:
-            checks.append("✓ 16-bit")
-        else:
-            checks.append(f"✗ {props['sample_width']*8}-bit (expected 16)")
-            all_valid = False
-
-        # 44.1 kHz sample rate
-        if props['framerate'] == 44100:
-            checks.append("✓ 44.1 kHz")
-        else:
-            checks.append(f"✗ {props['framerate']} Hz (expected 44100)")
-            all_valid = False
+        for attr, expected_value, label in FORMAT_CHECKS:
+            if props[attr] == expected_value:
+                checks.append(f"✓ {label}")
+            else:
+                checks.append(f"✗ {attr} is {props[attr]} (expected {label})")
+                all_valid = False
 
         # Duration in expected range
         duration = props['duration']
@@ -4,8 +4,71 @@ This mirrors the JavaScript Calculator class that will be implemented
 in the frontend, allowing us to validate the core calculation logic.
 """
 
-from decimal import Decimal, InvalidOperation
-from typing import Optional
+from collections.abc import Callable
+from decimal import Decimal, InvalidOperation, getcontext
+from operator import add, mul, sub, truediv
+from typing import Final
+
+# Floats carry ~15 significant digits; longer inputs fall back to Decimal
+MAX_FLOAT_DIGITS = 15
+
+# Every integer up to 2**53 is exactly representable as a float
+_MAX_EXACT_FLOAT_INT: Final = 2**53
+
+Number = float | Decimal
+
+_DIGITS: Final = frozenset("0123456789")
+
+_OPERATIONS: Final[dict[str, Callable[[Number, Number], Number]]] = {
+    "+": add,
+    "-": sub,
+    "*": mul,
+    "/": truediv,
+}
+_VALID_OPS: Final = frozenset(_OPERATIONS)
+
+
+def _parse_number(text: str) -> Number:
+    """
+    Parse a display string into a number.
+
+    Args:
+        text: Display string to parse
+
+    Returns:
+        A float, or a Decimal when the input has too many digits for a float
+
+    Raises:
+        ValueError: When the text is not a number
+    """
+    significant = text.lstrip("-0.").replace(".", "")
+    if len(significant) > MAX_FLOAT_DIGITS:
+        try:
+            return Decimal(text)
+        except InvalidOperation as e:
+            raise ValueError(f"Invalid number: {text}") from e
+    return float(text)
+
+
+def _format_number(formatted: str) -> str:
+    """
+    Trim a number's string form for display.
+
+    Args:
+        formatted: String representation of the number
+
+    Returns:
+        Formatted string for display
+    """
+    # Handle very large or very small numbers with scientific notation
+    if "E" in formatted or "e" in formatted:
+        return formatted
+
+    # Remove trailing zeros after decimal point
+    if "." in formatted:
+        formatted = formatted.rstrip("0").rstrip(".")
+
+    return formatted
 
 
 class Calculator:
@@ -14,9 +77,9 @@ class Calculator:
     def __init__(self):
         """Initialize calculator with default state."""
         self.display = "0"
-        self.current_value = Decimal("0")
-        self.previous_value: Optional[Decimal] = None
-        self.operation: Optional[str] = None
+        self.current_value: Number = 0.0
+        self.previous_value: Number | None = None
+        self.operation: str | None = None
         self.waiting_for_operand = False
         self.should_reset_display = False
 
@@ -30,7 +93,7 @@ class Calculator:
         Returns:
             Updated display value
         """
-        if not digit.isdigit():
+        if digit not in _DIGITS:
             raise ValueError(f"Invalid digit: {digit}")
 
         if self.waiting_for_operand or self.should_reset_display:
@@ -68,13 +131,12 @@ class Calculator:
         Returns:
             Updated display value
         """
-        valid_operators = {"+", "-", "*", "/"}
-        if operator not in valid_operators:
+        if operator not in _VALID_OPS:
             raise ValueError(f"Invalid operator: {operator}")
 
         try:
-            input_value = Decimal(self.display)
-        except InvalidOperation:
+            input_value = _parse_number(self.display)
+        except ValueError:
             return self.display
 
         if self.previous_value is None:
@@ -99,8 +161,8 @@ class Calculator:
             Result as display string
         """
         try:
-            input_value = Decimal(self.display)
-        except InvalidOperation:
+            input_value = _parse_number(self.display)
+        except ValueError:
             return self.display
 
         if self.operation and self.previous_value is not None:
@@ -123,7 +185,7 @@ class Calculator:
             Reset display value ("0")
         """
         self.display = "0"
-        self.current_value = Decimal("0")
+        self.current_value = 0.0
         self.previous_value = None
         self.operation = None
         self.waiting_for_operand = False
@@ -149,10 +211,9 @@ class Calculator:
             Updated display value
         """
         try:
-            value = Decimal(self.display)
-            value = -value
+            value = -_parse_number(self.display)
             self.display = self._format_display(value)
-        except InvalidOperation:
+        except ValueError:
             pass
 
         return self.display
@@ -165,17 +226,16 @@ class Calculator:
             Updated display value
         """
         try:
-            value = Decimal(self.display)
-            value = value / Decimal("100")
+            value = _parse_number(self.display) / 100
             self.display = self._format_display(value)
-        except InvalidOperation:
+        except ValueError:
             pass
 
         return self.display
 
     def _perform_calculation(
-        self, left: Decimal, right: Decimal, operator: str
-    ) -> Decimal:
+        self, left: Number, right: Number, operator: str
+    ) -> Number:
         """
         Perform binary calculation.
 
@@ -190,38 +250,46 @@ class Calculator:
         Raises:
             ZeroDivisionError: When dividing by zero
         """
-        if operator == "+":
-            return left + right
-        elif operator == "-":
-            return left - right
-        elif operator == "*":
-            return left * right
-        elif operator == "/":
-            if right == 0:
-                raise ZeroDivisionError("Cannot divide by zero")
-            return left / right
-        else:
+        if isinstance(left, Decimal) != isinstance(right, Decimal):
+            # Mixed precision: promote the float side to Decimal
+            left, right = Decimal(str(left)), Decimal(str(right))
+
+        operation = _OPERATIONS.get(operator)
+        if operation is None:
             raise ValueError(f"Unknown operator: {operator}")
+        if operation is truediv and right == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        result = operation(left, right)
+
+        if isinstance(result, float) and not abs(result) < 10**MAX_FLOAT_DIGITS:
+            # Result outgrew float precision: redo it exactly from the typed digits
+            result = operation(Decimal(repr(left)), Decimal(repr(right)))
+        return result
 
-    def _format_display(self, value: Decimal) -> str:
+    def _format_display(self, value: Number) -> str:
         """
-        Format decimal value for display.
+        Format numeric value for display.
 
         Args:
-            value: Decimal value to format
+            value: Float or Decimal value to format
 
         Returns:
             Formatted string for display
         """
-        # Remove trailing zeros and unnecessary decimal point
-        formatted = str(value)
-
-        # Handle very large or very small numbers with scientific notation
-        if "E" in formatted or "e" in formatted:
-            return formatted
-
-        # Remove trailing zeros after decimal point
-        if "." in formatted:
-            formatted = formatted.rstrip("0").rstrip(".")
+        # Fast path: whole numbers need no trailing-zero trimming
+        if isinstance(value, Decimal):
+            if (
+                value.is_finite()
+                and value == value.to_integral_value()
+                and value.adjusted() < getcontext().prec
+            ):
+                return str(int(value))
+            formatted = str(value)
+        elif value.is_integer() and abs(value) <= _MAX_EXACT_FLOAT_INT:
+            return str(int(value))
+        else:
+            # Round away float noise such as 0.1 + 0.2 = 0.30000000000000004
+            formatted = f"{value:.{MAX_FLOAT_DIGITS}g}"
 
-        return formatted
+        # Remove trailing zeros and unnecessary decimal point
+        return _format_number(formatted)
@@ -6,10 +6,17 @@ from fastapi.testclient import TestClient
 from calc3d.app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+    """Create a test client for the FastAPI application, shared across the session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def index_response(client):
+    """Fetch the home page once; its content is static for the whole session."""
+    return client.get("/")
 
 
 @pytest.fixture
@@ -1,34 +1,39 @@
 """Tests for FastAPI endpoints."""
 
 import pytest
+from fastapi.testclient import TestClient
 
+from calc3d.app import app
 
-def test_home_endpoint_returns_200(client):
-    """Test that home endpoint returns successful response."""
-    response = client.get("/")
-    assert response.status_code == 200
+
+@pytest.mark.parametrize(
+    ("path", "status_code"),
+    [
+        ("/", 200),
+        ("/health", 200),
+        ("/static/js/calculator.js", 200),
+        ("/nonexistent", 404),
+    ],
+)
+def test_endpoint_status_codes(client, path, status_code):
+    """Test that each endpoint returns the expected status code."""
+    response = client.get(path)
+    assert response.status_code == status_code
 
 
-def test_home_endpoint_returns_html(client):
+def test_home_endpoint_returns_html(index_response):
     """Test that home endpoint returns HTML content."""
-    response = client.get("/")
-    assert "text/html" in response.headers["content-type"]
+    assert "text/html" in index_response.headers["content-type"]
 
 
-def test_home_page_contains_calculator(client):
+def test_home_page_contains_calculator(index_response):
     """Test that home page contains calculator elements."""
-    response = client.get("/")
-    content = response.text
+    content = index_response.text
+    lowered = content.lower()
 
     assert "Calc3D" in content
-    assert "calculator" in content.lower()
-    assert "display" in content.lower()
-
-
-def test_health_endpoint_returns_200(client):
-    """Test that health check endpoint is accessible."""
-    response = client.get("/health")
-    assert response.status_code == 200
+    assert "calculator" in lowered
+    assert "display" in lowered
 
 
 def test_health_endpoint_returns_json(client):
@@ -47,13 +52,10 @@ def test_health_endpoint_contains_status(client):
     assert "version" in data
 
 
-def test_static_files_accessible(client):
-    """Test that static files are served correctly."""
-    response = client.get("/static/js/calculator.js")
-    assert response.status_code == 200
-
+def test_home_renders_without_lifespan(monkeypatch):
+    """Test the home page still renders when the startup lifespan hasn't run."""
+    monkeypatch.delattr(app.state, "index_html", raising=False)
+    response = TestClient(app).get("/")
 
-def test_nonexistent_endpoint_returns_404(client):
-    """Test that nonexistent endpoints return 404."""
-    response = client.get("/nonexistent")
-    assert response.status_code == 404
+    assert response.status_code == 200
+    assert "Calc3D" in response.text
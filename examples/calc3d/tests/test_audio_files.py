@@ -1,214 +1,158 @@
 """Tests for audio file validation and properties."""
 
+import hashlib
 import wave
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
+_SOUNDS_DIR = Path(__file__).resolve().parent.parent / "src" / "calc3d" / "static" / "sounds"
+
+SOUND_FILES: tuple[str, ...] = ('digit.wav', 'operator.wav', 'equals.wav', 'clear.wav', 'error.wav')
+
+# Expected specifications for each sound file (read-only, shared by all tests)
+_SOUND_SPECS = MappingProxyType({
+    'digit.wav': MappingProxyType(
+        {'min_duration': 0.04, 'max_duration': 0.06, 'min_size': 1000}
+    ),
+    'operator.wav': MappingProxyType(
+        {'min_duration': 0.07, 'max_duration': 0.09, 'min_size': 1000}
+    ),
+    'equals.wav': MappingProxyType(
+        {'min_duration': 0.14, 'max_duration': 0.16, 'min_size': 1000}
+    ),
+    'clear.wav': MappingProxyType(
+        {'min_duration': 0.14, 'max_duration': 0.16, 'min_size': 1000}
+    ),
+    'error.wav': MappingProxyType(
+        {'min_duration': 0.19, 'max_duration': 0.21, 'min_size': 1000}
+    ),
+})
+
+
+@pytest.fixture(scope="session")
+def sounds_dir():
+    """Path to sounds directory."""
+    return _SOUNDS_DIR
+
+
+@pytest.fixture(scope="session")
+def wav_meta(sounds_dir):
+    """WAV header metadata for each sound file, read once per session."""
+    meta = {}
+    for filename in SOUND_FILES:
+        filepath = sounds_dir / filename
+        with wave.open(str(filepath), 'rb') as wav:
+            meta[filename] = {
+                'channels': wav.getnchannels(),
+                'sampwidth': wav.getsampwidth(),
+                'rate': wav.getframerate(),
+                'frames': wav.getnframes(),
+                'size': filepath.stat().st_size,
+            }
+    return meta
+
+
+@pytest.fixture(scope="session")
+def sound_specs():
+    """Expected specifications for each sound file."""
+    return _SOUND_SPECS
+
 
 class TestAudioFileProperties:
     """Tests for validating generated audio files."""
 
-    @pytest.fixture
-    def sounds_dir(self):
-        """Path to sounds directory."""
-        return Path(__file__).parent.parent / "src" / "calc3d" / "static" / "sounds"
-
-    @pytest.fixture
-    def sound_specs(self):
-        """Expected specifications for each sound file."""
-        return {
-            'digit.wav': {
-                'min_duration': 0.04,
-                'max_duration': 0.06,
-                'min_size': 1000
-            },
-            'operator.wav': {
-                'min_duration': 0.07,
-                'max_duration': 0.09,
-                'min_size': 1000
-            },
-            'equals.wav': {
-                'min_duration': 0.14,
-                'max_duration': 0.16,
-                'min_size': 1000
-            },
-            'clear.wav': {
-                'min_duration': 0.14,
-                'max_duration': 0.16,
-                'min_size': 1000
-            },
-            'error.wav': {
-                'min_duration': 0.19,
-                'max_duration': 0.21,
-                'min_size': 1000
-            },
-        }
-
-    @pytest.mark.parametrize('filename', [
-        'digit.wav',
-        'operator.wav',
-        'equals.wav',
-        'clear.wav',
-        'error.wav',
-    ])
+    @pytest.mark.parametrize('filename', SOUND_FILES)
     def test_sound_file_exists(self, sounds_dir, filename):
         """Test that all sound files exist."""
         filepath = sounds_dir / filename
         assert filepath.exists(), f"{filename} not found"
 
-    @pytest.mark.parametrize('filename', [
-        'digit.wav',
-        'operator.wav',
-        'equals.wav',
-        'clear.wav',
-        'error.wav',
-    ])
-    def test_sound_file_is_valid_wav(self, sounds_dir, filename):
-        """Test that sound file is a valid WAV format."""
-        filepath = sounds_dir / filename
-
-        # Should not raise exception when opening as WAV
-        with wave.open(str(filepath), 'rb') as wav:
-            assert wav.getnchannels() > 0
-
-    @pytest.mark.parametrize('filename', [
-        'digit.wav',
-        'operator.wav',
-        'equals.wav',
-        'clear.wav',
-        'error.wav',
-    ])
-    def test_sound_file_is_mono(self, sounds_dir, filename):
-        """Test that sound file is mono (1 channel)."""
-        filepath = sounds_dir / filename
-
-        with wave.open(str(filepath), 'rb') as wav:
-            assert wav.getnchannels() == 1
-
-    @pytest.mark.parametrize('filename', [
-        'digit.wav',
-        'operator.wav',
-        'equals.wav',
-        'clear.wav',
-        'error.wav',
-    ])
-    def test_sound_file_is_16bit(self, sounds_dir, filename):
-        """Test that sound file is 16-bit audio."""
-        filepath = sounds_dir / filename
-
-        with wave.open(str(filepath), 'rb') as wav:
-            assert wav.getsampwidth() == 2  # 2 bytes = 16 bits
-
-    @pytest.mark.parametrize('filename', [
-        'digit.wav',
-        'operator.wav',
-        'equals.wav',
-        'clear.wav',
-        'error.wav',
-    ])
-    def test_sound_file_is_44100hz(self, sounds_dir, filename):
-        """Test that sound file has 44.1kHz sample rate."""
-        filepath = sounds_dir / filename
+    @pytest.mark.parametrize('filename', SOUND_FILES)
+    def test_sound_file_format(self, wav_meta, filename):
+        """Test that sound file is a valid mono, 16-bit, 44.1kHz WAV with audio data."""
+        meta = wav_meta[filename]  # Opened as WAV once by the fixture
 
-        with wave.open(str(filepath), 'rb') as wav:
-            assert wav.getframerate() == 44100
+        assert meta['channels'] == 1
+        assert meta['sampwidth'] == 2  # 2 bytes = 16 bits
+        assert meta['rate'] == 44100
+        assert meta['frames'] > 0
 
-    def test_sound_file_durations(self, sounds_dir, sound_specs):
+    def test_sound_file_durations(self, wav_meta, sound_specs):
         """Test that all sound files have correct durations."""
         for filename, specs in sound_specs.items():
-            filepath = sounds_dir / filename
+            meta = wav_meta[filename]
+            duration = meta['frames'] / meta['rate']
 
-            with wave.open(str(filepath), 'rb') as wav:
-                duration = wav.getnframes() / wav.getframerate()
+            assert specs['min_duration'] <= duration <= specs['max_duration'], \
+                f"{filename}: duration {duration:.3f}s not in range " \
+                f"{specs['min_duration']}-{specs['max_duration']}"
 
-                assert specs['min_duration'] <= duration <= specs['max_duration'], \
-                    f"{filename}: duration {duration:.3f}s not in range " \
-                    f"{specs['min_duration']}-{specs['max_duration']}"
-
-    def test_sound_file_sizes(self, sounds_dir, sound_specs):
+    def test_sound_file_sizes(self, wav_meta, sound_specs):
         """Test that all sound files have reasonable sizes (not placeholders)."""
         for filename, specs in sound_specs.items():
-            filepath = sounds_dir / filename
-            size = filepath.stat().st_size
+            size = wav_meta[filename]['size']
 
             assert size > specs['min_size'], \
                 f"{filename}: size {size} bytes is too small (< {specs['min_size']})"
 
-    def test_different_sounds_have_different_content(self, sounds_dir):
+    def test_different_sounds_have_different_content(self, sounds_dir, wav_meta):
         """Test that sound files are unique (not duplicates)."""
-        sound_files = ['digit.wav', 'operator.wav', 'equals.wav', 'clear.wav', 'error.wav']
-        file_contents = {}
-
-        for filename in sound_files:
-            filepath = sounds_dir / filename
-            with open(filepath, 'rb') as f:
-                file_contents[filename] = f.read()
-
-        # Compare each pair of files
-        for i, file1 in enumerate(sound_files):
-            for file2 in sound_files[i + 1:]:
-                assert file_contents[file1] != file_contents[file2], \
+        digests = {}
+
+        def digest(filename):
+            if filename not in digests:
+                data = (sounds_dir / filename).read_bytes()
+                digests[filename] = hashlib.blake2b(data, digest_size=16).digest()
+            return digests[filename]
+
+        # Compare each pair of files; different sizes already means different content
+        for i, file1 in enumerate(SOUND_FILES):
+            for file2 in SOUND_FILES[i + 1:]:
+                if wav_meta[file1]['size'] != wav_meta[file2]['size']:
+                    continue
+                assert digest(file1) != digest(file2), \
                     f"{file1} and {file2} have identical content"
 
 
+def _duration(meta):
+    """Duration in seconds from cached WAV metadata."""
+    return meta['frames'] / meta['rate']
+
+
 class TestSoundFileIntegrity:
     """Tests for sound file data integrity."""
 
-    @pytest.fixture
-    def sounds_dir(self):
-        """Path to sounds directory."""
-        return Path(__file__).parent.parent / "src" / "calc3d" / "static" / "sounds"
-
-    def test_digit_sound_is_short_beep(self, sounds_dir):
+    def test_digit_sound_is_short_beep(self, wav_meta):
         """Test that digit sound is a short beep (~50ms)."""
-        filepath = sounds_dir / "digit.wav"
-
-        with wave.open(str(filepath), 'rb') as wav:
-            duration = wav.getnframes() / wav.getframerate()
-            # Should be around 0.05 seconds
-            assert 0.04 <= duration <= 0.06
+        duration = _duration(wav_meta['digit.wav'])
+        # Should be around 0.05 seconds
+        assert 0.04 <= duration <= 0.06
 
-    def test_operator_sound_is_medium_beep(self, sounds_dir):
+    def test_operator_sound_is_medium_beep(self, wav_meta):
         """Test that operator sound is slightly longer (~80ms)."""
-        filepath = sounds_dir / "operator.wav"
-
-        with wave.open(str(filepath), 'rb') as wav:
-            duration = wav.getnframes() / wav.getframerate()
-            # Should be around 0.08 seconds
-            assert 0.07 <= duration <= 0.09
+        duration = _duration(wav_meta['operator.wav'])
+        # Should be around 0.08 seconds
+        assert 0.07 <= duration <= 0.09
 
-    def test_equals_and_clear_have_similar_duration(self, sounds_dir):
+    def test_equals_and_clear_have_similar_duration(self, wav_meta):
         """Test that equals and clear sounds have similar durations."""
-        with wave.open(str(sounds_dir / "equals.wav"), 'rb') as wav:
-            equals_duration = wav.getnframes() / wav.getframerate()
-
-        with wave.open(str(sounds_dir / "clear.wav"), 'rb') as wav:
-            clear_duration = wav.getnframes() / wav.getframerate()
+        equals_duration = _duration(wav_meta['equals.wav'])
+        clear_duration = _duration(wav_meta['clear.wav'])
 
         # Both should be around 0.15 seconds
         assert abs(equals_duration - clear_duration) < 0.01
 
-    def test_error_sound_is_longest(self, sounds_dir):
+    def test_error_sound_is_longest(self, wav_meta):
         """Test that error sound is the longest duration."""
-        durations = {}
-        sound_files = ['digit.wav', 'operator.wav', 'equals.wav', 'clear.wav', 'error.wav']
+        # All files share one sample rate, so frame counts order like durations
+        assert wav_meta['error.wav']['frames'] == max(m['frames'] for m in wav_meta.values())
 
-        for filename in sound_files:
-            with wave.open(str(sounds_dir / filename), 'rb') as wav:
-                durations[filename] = wav.getnframes() / wav.getframerate()
-
-        # Error should be the longest
-        assert durations['error.wav'] == max(durations.values())
-
-    def test_all_sounds_have_frames(self, sounds_dir):
+    def test_all_sounds_have_frames(self, wav_meta):
         """Test that all sound files contain audio data."""
-        sound_files = ['digit.wav', 'operator.wav', 'equals.wav', 'clear.wav', 'error.wav']
-
-        for filename in sound_files:
-            with wave.open(str(sounds_dir / filename), 'rb') as wav:
-                frames = wav.getnframes()
-                assert frames > 0, f"{filename} has no audio frames"
+        for filename, meta in wav_meta.items():
+            assert meta['frames'] > 0, f"{filename} has no audio frames"
 
     def test_sounds_directory_exists(self, sounds_dir):
         """Test that sounds directory exists."""
@@ -217,13 +161,7 @@ class TestSoundFileIntegrity:
 
     def test_no_extra_sound_files(self, sounds_dir):
         """Test that only expected sound files exist (no leftovers)."""
-        expected_files = {
-            'digit.wav',
-            'operator.wav',
-            'equals.wav',
-            'clear.wav',
-            'error.wav'
-        }
+        expected_files = set(SOUND_FILES)
 
         actual_files = {f.name for f in sounds_dir.glob('*.wav')}
 
@@ -1,7 +1,6 @@
 """Tests for calculator logic engine."""
 
 import pytest
-from decimal import Decimal
 
 from tests.calculator_logic import Calculator
 
@@ -16,7 +15,7 @@ def test_calculator_initial_state():
     calc = Calculator()
 
     assert calc.display == "0"
-    assert calc.current_value == Decimal("0")
+    assert calc.current_value == 0
     assert calc.previous_value is None
     assert calc.operation is None
 
@@ -42,52 +41,25 @@ def test_multiple_digit_input():
     assert result == "123"
 
 
-def test_basic_addition():
-    """Test simple addition operation."""
+@pytest.mark.parametrize(
+    ("left", "operator", "right", "expected"),
+    [
+        ("5", "+", "3", "8"),
+        ("9", "-", "4", "5"),
+        ("6", "*", "7", "42"),
+        ("8", "/", "2", "4"),
+    ],
+)
+def test_basic_operations(left, operator, right, expected):
+    """Test simple addition, subtraction, multiplication and division."""
     calc = Calculator()
 
-    calc.input_digit("5")
-    calc.input_operator("+")
-    calc.input_digit("3")
+    calc.input_digit(left)
+    calc.input_operator(operator)
+    calc.input_digit(right)
     result = calc.calculate()
 
-    assert result == "8"
-
-
-def test_basic_subtraction():
-    """Test simple subtraction operation."""
-    calc = Calculator()
-
-    calc.input_digit("9")
-    calc.input_operator("-")
-    calc.input_digit("4")
-    result = calc.calculate()
-
-    assert result == "5"
-
-
-def test_basic_multiplication():
-    """Test simple multiplication operation."""
-    calc = Calculator()
-
-    calc.input_digit("6")
-    calc.input_operator("*")
-    calc.input_digit("7")
-    result = calc.calculate()
-
-    assert result == "42"
-
-
-def test_basic_division():
-    """Test simple division operation."""
-    calc = Calculator()
-
-    calc.input_digit("8")
-    calc.input_operator("/")
-    calc.input_digit("2")
-    result = calc.calculate()
-
-    assert result == "4"
+    assert result == expected
 
 
 # ============================================================================
@@ -257,7 +229,7 @@ def test_clear_entry_clears_display():
 
     assert result == "0"
     assert calc.display == "0"
-    assert calc.previous_value == Decimal("5")  # Previous value preserved
+    assert calc.previous_value == 5  # Previous value preserved
     assert calc.operation == "+"  # Operation preserved
 
 
@@ -332,6 +304,69 @@ def test_display_removes_unnecessary_decimal():
     assert result == "2"  # Not "2.0"
 
 
+def test_display_hides_float_rounding_noise():
+    """Test display shows 0.1 + 0.2 as 0.3."""
+    calc = Calculator()
+
+    calc.input_decimal()
+    calc.input_digit("1")
+    calc.input_operator("+")
+    calc.input_decimal()
+    calc.input_digit("2")
+    result = calc.calculate()
+
+    assert result == "0.3"
+
+
+def test_long_numbers_keep_full_precision():
+    """Test numbers beyond float precision are calculated exactly."""
+    calc = Calculator()
+
+    for digit in "12345678901234567":
+        calc.input_digit(digit)
+    calc.input_operator("+")
+    calc.input_digit("1")
+    result = calc.calculate()
+
+    assert result == "12345678901234568"
+
+
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    [
+        ("99999999", "99999999", "9999999800000001"),
+        ("1000000", "1000000000", "1000000000000000"),
+    ],
+)
+def test_large_products_keep_full_precision(left, right, expected):
+    """Test products that outgrow float precision are calculated exactly."""
+    calc = Calculator()
+
+    for digit in left:
+        calc.input_digit(digit)
+    calc.input_operator("*")
+    for digit in right:
+        calc.input_digit(digit)
+    result = calc.calculate()
+
+    assert result == expected
+
+
+def test_display_shows_whole_division_result_as_integer():
+    """Test whole-number results display without exponent or decimals."""
+    calc = Calculator()
+
+    calc.input_digit("1")
+    calc.input_digit("0")
+    calc.input_digit("0")
+    calc.input_operator("/")
+    calc.input_digit("1")
+    calc.input_digit("0")
+    result = calc.calculate()
+
+    assert result == "10"
+
+
 # ============================================================================
 # STATE MANAGEMENT
 # ============================================================================
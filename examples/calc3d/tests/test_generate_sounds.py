@@ -1,30 +1,54 @@
 """Tests for sound generation functions."""
 
-import struct
+import array
 import wave
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import numpy as np
 import pytest
 
 from generate_sounds import (
+    file_is_fresh,
     generate_beep,
+    generate_chirp,
     generate_chord,
     generate_tone_wave,
+    make_envelope,
     save_wav,
 )
 
 
+class TestMakeEnvelope:
+    """Tests for make_envelope function."""
+
+    def test_envelope_fades_in_and_out(self):
+        """Test that envelope starts and ends silent with full gain in between."""
+        envelope = make_envelope(4410, 44100, 0.1)
+
+        assert len(envelope) == 4410
+        assert envelope[0] == 0.0
+        assert envelope[len(envelope) // 2] == 1.0
+        assert envelope[-1] < 0.01
+
+    def test_envelope_stays_within_unit_range(self):
+        """Test that envelope gains are between 0 and 1."""
+        envelope = make_envelope(2205, 44100, 0.05)
+
+        assert envelope.min() >= 0.0
+        assert envelope.max() <= 1.0
+
+
 class TestGenerateToneWave:
     """Tests for generate_tone_wave function."""
 
-    def test_returns_list_of_samples(self):
-        """Test that generate_tone_wave returns a list of integer samples."""
+    def test_returns_array_of_samples(self):
+        """Test that generate_tone_wave returns an array of 16-bit samples."""
         samples = generate_tone_wave(440, 0.1)
 
-        assert isinstance(samples, list)
+        assert isinstance(samples, np.ndarray)
         assert len(samples) > 0
-        assert all(isinstance(s, int) for s in samples)
+        assert samples.dtype == np.int16
 
     def test_sample_count_matches_duration(self):
         """Test that number of samples matches duration and sample rate."""
@@ -39,7 +63,8 @@ class TestGenerateToneWave:
         """Test that samples are within 16-bit signed integer range."""
         samples = generate_tone_wave(440, 0.1)
 
-        assert all(-32768 <= s <= 32767 for s in samples)
+        assert samples.min() >= -32768
+        assert samples.max() <= 32767
 
     def test_different_frequencies_produce_different_patterns(self):
         """Test that different frequencies generate different waveforms."""
@@ -47,7 +72,7 @@ class TestGenerateToneWave:
         samples_880 = generate_tone_wave(880, 0.01, sample_rate=44100)
 
         # Different frequencies should produce different patterns
-        assert samples_440 != samples_880
+        assert not np.array_equal(samples_440, samples_880)
 
     def test_zero_duration_returns_empty_list(self):
         """Test that zero duration produces empty sample list."""
@@ -61,8 +86,8 @@ class TestGenerateToneWave:
         samples_high = generate_tone_wave(440, 0.01, volume=0.9)
 
         # Higher volume should generally produce higher absolute values
-        avg_low = sum(abs(s) for s in samples_low) / len(samples_low)
-        avg_high = sum(abs(s) for s in samples_high) / len(samples_high)
+        avg_low = np.abs(samples_low).mean()
+        avg_high = np.abs(samples_high).mean()
 
         assert avg_high > avg_low
 
@@ -97,6 +122,18 @@ class TestSaveWav:
                 assert wav.getframerate() == sample_rate
                 assert wav.getnframes() == len(samples)
 
+    def test_accepts_list_and_array_samples(self):
+        """Test that list and array.array samples are written identically."""
+        with TemporaryDirectory() as tmpdir:
+            list_path = Path(tmpdir) / "list.wav"
+            array_path = Path(tmpdir) / "array.wav"
+            samples = generate_tone_wave(440, 0.01).tolist()
+
+            save_wav(list_path, samples)
+            save_wav(array_path, array.array('h', samples))
+
+            assert list_path.read_bytes() == array_path.read_bytes()
+
     def test_empty_samples_creates_silent_file(self):
         """Test that empty sample list creates valid but silent file."""
         with TemporaryDirectory() as tmpdir:
@@ -135,6 +172,33 @@ class TestGenerateBeep:
                 assert abs(actual_duration - duration) < 0.001  # Within 1ms
 
 
+class TestGenerateChirp:
+    """Tests for generate_chirp function."""
+
+    def test_chirp_duration_matches_specification(self):
+        """Test that generated chirp has correct duration."""
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "chirp.wav"
+            duration = 0.15
+
+            generate_chirp(600, 1200, duration, filepath)
+
+            with wave.open(str(filepath), 'rb') as wav:
+                actual_duration = wav.getnframes() / wav.getframerate()
+                assert abs(actual_duration - duration) < 0.001
+
+    def test_rising_and_falling_chirps_differ(self):
+        """Test that sweep direction changes the waveform."""
+        with TemporaryDirectory() as tmpdir:
+            rising_path = Path(tmpdir) / "rising.wav"
+            falling_path = Path(tmpdir) / "falling.wav"
+
+            generate_chirp(600, 1200, 0.05, rising_path)
+            generate_chirp(1200, 600, 0.05, falling_path)
+
+            assert rising_path.read_bytes() != falling_path.read_bytes()
+
+
 class TestGenerateChord:
     """Tests for generate_chord function."""
 
@@ -182,3 +246,33 @@ class TestGenerateChord:
             generate_chord([], 0.1, filepath)
 
             assert filepath.exists()
+
+
+class TestFileIsFresh:
+    """Tests for file_is_fresh function."""
+
+    def test_matching_file_is_fresh(self):
+        """Test that a file generated with the expected spec is fresh."""
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "beep.wav"
+            generate_beep(800, 0.05, filepath)
+
+            assert file_is_fresh(filepath, 0.05)
+
+    def test_different_duration_is_stale(self):
+        """Test that a file with a different length is not fresh."""
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "beep.wav"
+            generate_beep(800, 0.05, filepath)
+
+            assert not file_is_fresh(filepath, 0.08)
+
+    def test_missing_or_invalid_file_is_stale(self):
+        """Test that missing and non-WAV files are not fresh."""
+        with TemporaryDirectory() as tmpdir:
+            missing = Path(tmpdir) / "missing.wav"
+            invalid = Path(tmpdir) / "invalid.wav"
+            invalid.write_bytes(b"not a wav file")
+
+            assert not file_is_fresh(missing, 0.05)
+            assert not file_is_fresh(invalid, 0.05)
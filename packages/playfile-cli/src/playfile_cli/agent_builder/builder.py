@@ -3,19 +3,76 @@
 from __future__ import annotations
 
 import json
+import os
+import re
+from collections.abc import Callable, Sequence
+from contextlib import aclosing
 from dataclasses import dataclass
+from operator import attrgetter, methodcaller
 from pathlib import Path
+from typing import Any
 
 from claude_agent_sdk import query
-from claude_agent_sdk.types import ClaudeAgentOptions
+from claude_agent_sdk.types import ClaudeAgentOptions, TextBlock
 
 from playfile_cli.agent_builder.prompts import (
     AGENT_BUILDER_SYSTEM_PROMPT,
     build_agent_creation_prompt,
 )
 
+# JSON object inside a markdown code fence (```json or bare ```)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
 
-@dataclass
+# agents.yaml entry appended for each generated agent
+_AGENT_YAML_TEMPLATE = """  - id: {id}
+    role: "{role}"
+    model: {model}
+    instructions: {instructions}
+    tools:
+      mode: {tools_mode}
+      commands: [{tools_commands}]
+    limits:
+      runtime: "{runtime}"
+      iterations: {iterations}
+"""
+
+# Tools offered to Claude when the project config lists none
+_DEFAULT_TOOLS: tuple[str, ...] = (
+    "git",
+    "python",
+    "pytest",
+    "ruff",
+    "node",
+    "npm",
+    "npx",
+    "make",
+    "cat",
+    "ls",
+)
+
+# Text extractors for the content block types seen in practice, keyed by exact type
+_BLOCK_TEXT_EXTRACTORS: dict[type, Callable[[Any], str | None]] = {
+    TextBlock: attrgetter("text"),
+    dict: methodcaller("get", "text"),
+}
+
+
+def _block_text(block: Any) -> str | None:
+    """Return the text carried by a content block, if any.
+
+    Args:
+        block: Content block from a Claude message
+
+    Returns:
+        Block text, or None for blocks without text (tool use, thinking, ...)
+    """
+    extract = _BLOCK_TEXT_EXTRACTORS.get(type(block))
+    if extract is not None:
+        return extract(block)
+    return getattr(block, "text", None)
+
+
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     """Generated agent configuration."""
 
@@ -30,17 +87,136 @@ class AgentConfig:
     instructions_content: str
 
 
+# Opening fence the prompt asks Claude to wrap the agent JSON in
+_JSON_FENCE_OPEN = "```json"
+
+# Keys AgentConfig is built from, checked before the stream is cut short
+_AGENT_KEYS = ("id", "role", "model", "instructions_file", "tools", "limits")
+_AGENT_TOOLS_KEYS = ("mode", "commands")
+_AGENT_LIMITS_KEYS = ("runtime", "iterations")
+
+
+def _is_agent_data(data: Any) -> bool:
+    """Check that parsed JSON has every field needed to build an AgentConfig.
+
+    Args:
+        data: Parsed JSON value
+
+    Returns:
+        True if the value is a complete agent response
+    """
+    if not isinstance(data, dict) or "instructions_content" not in data:
+        return False
+    agent = data.get("agent")
+    if not isinstance(agent, dict) or not all(key in agent for key in _AGENT_KEYS):
+        return False
+    tools, limits = agent["tools"], agent["limits"]
+    return (
+        isinstance(tools, dict)
+        and all(key in tools for key in _AGENT_TOOLS_KEYS)
+        and isinstance(limits, dict)
+        and all(key in limits for key in _AGENT_LIMITS_KEYS)
+    )
+
+
+class _AgentJsonScanner:
+    """Finds the agent JSON object in streamed text as soon as it is complete.
+
+    Only objects opened inside a ```json fence are considered, so example
+    objects in surrounding prose are skipped just like the fence regex does.
+    Tracks brace depth (ignoring braces inside JSON strings) across chunks, so
+    the response can be parsed the moment the top-level object closes instead
+    of after the whole stream has been collected.
+    """
+
+    def __init__(self) -> None:
+        """Initialize scanner state."""
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._in_fence = False
+        # End of the previous chunk, in case the opening fence is split across chunks
+        self._fence_tail = ""
+
+    def feed(self, text: str) -> dict[str, Any] | None:
+        """Scan the next chunk of response text.
+
+        Args:
+            text: Chunk of text from Claude's response
+
+        Returns:
+            Parsed agent data once a complete, fenced object with every
+            AgentConfig field has been seen, None otherwise
+        """
+        index = 0
+        length = len(text)
+        while index < length:
+            if not self._in_fence:
+                window = self._fence_tail + text[index:]
+                found = window.find(_JSON_FENCE_OPEN)
+                if found == -1:
+                    self._fence_tail = window[-(len(_JSON_FENCE_OPEN) - 1) :]
+                    return None
+                index += found + len(_JSON_FENCE_OPEN) - len(self._fence_tail)
+                self._fence_tail = ""
+                self._in_fence = True
+
+            if self._depth == 0:
+                index = text.find("{", index)
+                if index == -1:
+                    return None
+            segment_start = index
+
+            while index < length:
+                char = text[index]
+                index += 1
+                if self._in_string:
+                    if self._escaped:
+                        self._escaped = False
+                    elif char == "\\":
+                        self._escaped = True
+                    elif char == '"':
+                        self._in_string = False
+                elif char == '"':
+                    self._in_string = True
+                elif char == "{":
+                    self._depth += 1
+                elif char == "}":
+                    self._depth -= 1
+                    if self._depth == 0:
+                        break
+
+            self._parts.append(text[segment_start:index])
+            if self._depth == 0:
+                candidate = "".join(self._parts)
+                self._parts = []
+                # Whatever this fence held, the next candidate must open a new one
+                self._in_fence = False
+                try:
+                    data = json.loads(candidate)
+                except json.JSONDecodeError:
+                    continue
+                if _is_agent_data(data):
+                    return data
+
+        return None
+
+
 class AgentBuilder:
     """Builds custom agents using Claude's intelligence via claude-agent-sdk."""
 
     async def build_agent(
-        self, user_instructions: str, available_tools: list[str] | None = None, working_dir: str | None = None
+        self,
+        user_instructions: str,
+        available_tools: Sequence[str] | None = None,
+        working_dir: str | None = None,
     ) -> AgentConfig:
         """Use Claude to build an intelligent agent configuration.
 
         Args:
             user_instructions: User's description of what the agent should do
-            available_tools: List of available tool IDs (defaults to common tools)
+            available_tools: Available tool IDs (defaults to common tools)
             working_dir: Current working directory for project exploration
 
         Returns:
@@ -51,74 +227,59 @@ class AgentBuilder:
             RuntimeError: If query fails
         """
         if available_tools is None:
-            available_tools = [
-                "git",
-                "python",
-                "pytest",
-                "ruff",
-                "node",
-                "npm",
-                "npx",
-                "make",
-                "cat",
-                "ls",
-            ]
+            available_tools = _DEFAULT_TOOLS
 
         # Build prompt with working directory context
         user_prompt = build_agent_creation_prompt(user_instructions, available_tools, working_dir)
 
-        # Combine system and user prompt
-        full_prompt = f"{AGENT_BUILDER_SYSTEM_PROMPT}\n\n{user_prompt}"
-
         try:
-            # Query Claude using claude-agent-sdk
+            # Query Claude using claude-agent-sdk. The system prompt is a static
+            # module constant and every per-call value (instructions, tools,
+            # working dir) goes in the user prompt, so the system prompt stays
+            # a byte-identical, cacheable prefix across agent creations.
             options = ClaudeAgentOptions(
                 system_prompt=AGENT_BUILDER_SYSTEM_PROMPT,
                 permission_mode="bypassPermissions",  # No need for permissions for this task
                 cwd=working_dir,  # Set working directory for file exploration
             )
 
-            # Collect all messages from Claude's response
-            final_content = ""
-            async for message in query(prompt=user_prompt, options=options):
-                # Try to extract content from any message type
-                if hasattr(message, "content"):
-                    if isinstance(message.content, str):
-                        final_content += message.content
-                    elif isinstance(message.content, list):
-                        for block in message.content:
-                            if hasattr(block, "text"):
-                                final_content += block.text
-                            elif isinstance(block, dict) and "text" in block:
-                                final_content += block["text"]
-
-            if not final_content:
+            # Collect messages from Claude's response, stopping as soon as the
+            # agent JSON object is complete
+            parts: list[str] = []
+            scanner = _AgentJsonScanner()
+            data: dict[str, Any] | None = None
+            async with aclosing(query(prompt=user_prompt, options=options)) as messages:
+                async for message in messages:
+                    # Try to extract content from any message type
+                    message_content = getattr(message, "content", None)
+                    if isinstance(message_content, str):
+                        texts = [message_content]
+                    elif isinstance(message_content, list):
+                        texts = [
+                            text for block in message_content if (text := _block_text(block))
+                        ]
+                    else:
+                        continue
+
+                    for text in texts:
+                        parts.append(text)
+                        data = scanner.feed(text)
+                        if data is not None:
+                            break
+                    if data is not None:
+                        break
+
+            content = "".join(parts)
+            if not content:
                 msg = "Empty response from Claude"
                 raise ValueError(msg)
 
-            content = final_content
-
-            # Parse JSON response - always try extracting from code blocks first
-            data = None
-
-            # Try to extract JSON from markdown code blocks
-            if "```json" in content:
-                json_start = content.find("```json") + 7
-                json_end = content.rfind("```")  # Use rfind to get the last closing backticks
-                if json_end > json_start:
-                    json_str = content[json_start:json_end].strip()
-                    try:
-                        data = json.loads(json_str)
-                    except json.JSONDecodeError:
-                        pass
-
-            if data is None and "```" in content:
-                json_start = content.find("```") + 3
-                json_end = content.rfind("```")
-                if json_end > json_start:
-                    json_str = content[json_start:json_end].strip()
+            # Try to extract JSON from a markdown code block
+            if data is None:
+                match = _JSON_FENCE_RE.search(content)
+                if match:
                     try:
-                        data = json.loads(json_str)
+                        data = json.loads(match.group(1))
                     except json.JSONDecodeError:
                         pass
 
@@ -164,6 +325,8 @@ class AgentWriter:
             project_root: Root directory of the project
         """
         self._project_root = project_root
+        # Directories already created by this writer, to skip repeat mkdir calls
+        self._ensured_dirs: set[Path] = set()
 
     def write_agent(self, config: AgentConfig) -> tuple[Path, Path]:
         """Write agent configuration to files.
@@ -185,14 +348,21 @@ class AgentWriter:
 
         # Write instructions file
         instructions_path = self._project_root / config.instructions_file
-        instructions_path.parent.mkdir(parents=True, exist_ok=True)
-        instructions_path.write_text(config.instructions_content, encoding="utf-8")
-
-        # Append to agents.yaml
-        agent_yaml = self._generate_agent_yaml(config)
-        with agents_yaml_path.open("a", encoding="utf-8") as f:
-            f.write("\n")
-            f.write(agent_yaml)
+        instructions_dir = instructions_path.parent
+        if instructions_dir not in self._ensured_dirs:
+            instructions_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(instructions_dir)
+        instructions_path.write_bytes(config.instructions_content.encode("utf-8"))
+
+        # Append to agents.yaml as a single pre-encoded write
+        payload = ("\n" + self._generate_agent_yaml(config)).encode("utf-8")
+        fd = os.open(agents_yaml_path, os.O_WRONLY | os.O_APPEND)
+        try:
+            written = os.write(fd, payload)
+            while written < len(payload):
+                written += os.write(fd, payload[written:])
+        finally:
+            os.close(fd)
 
         return agents_yaml_path, instructions_path
 
@@ -205,16 +375,18 @@ class AgentWriter:
         Returns:
             YAML string for the agent
         """
-        tools_commands = ", ".join(f'"{cmd}"' for cmd in config.tools_commands)
-
-        return f"""  - id: {config.id}
-    role: "{config.role}"
-    model: {config.model}
-    instructions: {config.instructions_file}
-    tools:
-      mode: {config.tools_mode}
-      commands: [{tools_commands}]
-    limits:
-      runtime: "{config.runtime}"
-      iterations: {config.iterations}
-"""
+        commands = config.tools_commands
+        tools_commands = '"' + '", "'.join(commands) + '"' if commands else ""
+
+        return _AGENT_YAML_TEMPLATE.format_map(
+            {
+                "id": config.id,
+                "role": config.role,
+                "model": config.model,
+                "instructions": config.instructions_file,
+                "tools_mode": config.tools_mode,
+                "tools_commands": tools_commands,
+                "runtime": config.runtime,
+                "iterations": config.iterations,
+            }
+        )
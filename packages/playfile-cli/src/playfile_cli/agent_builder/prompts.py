@@ -1,5 +1,10 @@
 """Prompts for Claude to intelligently build custom agents."""
 
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+
 AGENT_BUILDER_SYSTEM_PROMPT = """You are an expert at designing AI agent configurations for development workflows.
 
 Your task is to analyze user requirements and generate a complete agent configuration including:
@@ -127,20 +132,42 @@ You must respond with a valid JSON object with this exact structure:
 6. Consider security and safety in tool access
 """
 
-def build_agent_creation_prompt(user_instructions: str, available_tools: list[str], working_dir: str | None = None) -> str:
+def build_agent_creation_prompt(
+    user_instructions: str,
+    available_tools: Sequence[str],
+    working_dir: str | None = None,
+) -> str:
     """Build the prompt for Claude to create an agent.
 
     Args:
         user_instructions: User's description of what the agent should do
-        available_tools: List of available tool IDs
+        available_tools: Available tool IDs
         working_dir: Current working directory
 
     Returns:
         Complete prompt for Claude
     """
-    context = f"""Create a custom agent configuration based on these user requirements:
+    suffix = _agent_creation_prompt_suffix(tuple(available_tools), working_dir)
+    return f"""Create a custom agent configuration based on these user requirements:
+
+{user_instructions}{suffix}"""
+
+
+@lru_cache(maxsize=32)
+def _agent_creation_prompt_suffix(available_tools: tuple[str, ...], working_dir: str | None) -> str:
+    """Build the part of the agent creation prompt that follows the user's instructions.
+
+    It depends only on the tools and working directory, which rarely change
+    between calls, so it is cached.
 
-{user_instructions}
+    Args:
+        available_tools: Available tool IDs
+        working_dir: Current working directory
+
+    Returns:
+        Prompt text following the user's instructions
+    """
+    context = f"""
 
 Available tools in this project:
 {', '.join(available_tools)}"""
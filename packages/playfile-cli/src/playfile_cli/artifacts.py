@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+_CONTEXT_HEADER = "## Context from Previous Steps\n"
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class StepArtifact:
     """Artifact produced by an agent step.
 
     Contains a summary of the step's work to pass to subsequent agents.
+    Frozen, so its formatted context can be computed once and reused.
     """
 
     step_number: int
@@ -35,8 +38,14 @@ class ArtifactCollector:
 
     def __init__(self) -> None:
         """Initialize artifact collector."""
-        self._artifacts: list[StepArtifact] = []
-        self._artifacts_by_id: dict[str, StepArtifact] = {}
+        # Formatted context of every step, in step order
+        self._contexts: list[str] = []
+        # Formatted context by step ID; a repeated ID points at its latest step
+        self._contexts_by_id: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of collected artifacts."""
+        return len(self._contexts)
 
     def add_artifact(self, artifact: StepArtifact) -> None:
         """Add an artifact to the collection.
@@ -44,9 +53,10 @@ class ArtifactCollector:
         Args:
             artifact: Artifact to add
         """
-        self._artifacts.append(artifact)
+        context = artifact.format_for_context()
+        self._contexts.append(context)
         if artifact.step_id:
-            self._artifacts_by_id[artifact.step_id] = artifact
+            self._contexts_by_id[artifact.step_id] = context
 
     def get_context_for_next_step(self, context_from: list[str] | None = None) -> str:
         """Get formatted context from specified or all previous artifacts.
@@ -57,34 +67,21 @@ class ArtifactCollector:
         Returns:
             Formatted string with artifact summaries
         """
-        if not self._artifacts:
+        if not self._contexts:
             return ""
 
-        # If context_from is specified, filter artifacts
+        # If context_from is specified, filter artifacts (unknown step IDs are skipped)
         if context_from is not None:
-            artifacts_to_include = []
-            for step_id in context_from:
-                if step_id in self._artifacts_by_id:
-                    artifacts_to_include.append(self._artifacts_by_id[step_id])
-                else:
-                    # Warning: step_id not found, but don't fail
-                    pass
-
-            if not artifacts_to_include:
+            if not context_from:
                 return ""
-
-            context_parts = ["## Context from Previous Steps\n"]
-            for artifact in artifacts_to_include:
-                context_parts.append(artifact.format_for_context())
-
-            return "\n".join(context_parts)
+            contexts = self._contexts_by_id
+            selected = [contexts[step_id] for step_id in context_from if step_id in contexts]
+            if not selected:
+                return ""
+            return "\n".join((_CONTEXT_HEADER, *selected))
 
         # Default: include all artifacts
-        context_parts = ["## Context from Previous Steps\n"]
-        for artifact in self._artifacts:
-            context_parts.append(artifact.format_for_context())
-
-        return "\n".join(context_parts)
+        return "\n".join((_CONTEXT_HEADER, *self._contexts))
 
     def has_artifacts(self) -> bool:
         """Check if any artifacts have been collected.
@@ -92,4 +89,4 @@ class ArtifactCollector:
         Returns:
             True if artifacts exist
         """
-        return len(self._artifacts) > 0
+        return bool(self._contexts)
@@ -2,19 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
+import os
 from pathlib import Path
 
 import rich_click as click
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
 
-from playfile_cli.agent_builder import AgentBuilder
-from playfile_cli.agent_builder.builder import AgentConfig, AgentWriter
 from playfile_cli.commands.create_task import create_task
 from playfile_cli.commands.create_tool import create_tool
-from playfile_cli.config_loader import ConfigLoader
 
 
 @click.group(name="create")
@@ -63,6 +59,13 @@ def create_agent(
     The agent will be added to .play/agents.yaml and instructions saved to
     .play/agents/<agent-id>.md
     """
+    # Deferred so the Claude SDK is only loaded when an agent is actually built
+    import asyncio
+
+    from playfile_cli.agent_builder import AgentBuilder
+    from playfile_cli.agent_builder.builder import AgentConfig, AgentWriter
+    from playfile_cli.config_loader import ConfigLoader
+
     console = Console()
 
     try:
@@ -169,7 +172,10 @@ def create_agent(
         raise click.Abort from e
     except Exception as e:
         console.print(f"[bold red]✗ Unexpected error:[/bold red] {e}")
-        console.print_exception()
+        if os.environ.get("PLAYFILE_DEBUG") == "1":
+            console.print_exception()
+        else:
+            console.print("[dim]Set PLAYFILE_DEBUG=1 for traceback[/dim]")
         raise click.Abort from e
 
 
@@ -2,17 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
+import os
 from pathlib import Path
 
 import rich_click as click
 from rich.console import Console
 from rich.panel import Panel
 
-from playfile_cli.config_loader import ConfigLoader
-from playfile_cli.task_builder import TaskBuilder
-from playfile_cli.task_builder.builder import TaskWriter
-
 
 @click.command(name="task")
 @click.argument("name")
@@ -48,6 +44,13 @@ def create_task(
 
     The task will be added to playfile.yaml
     """
+    # Deferred so the Claude SDK is only loaded when a task is actually built
+    import asyncio
+
+    from playfile_cli.config_loader import ConfigLoader
+    from playfile_cli.task_builder import TaskBuilder
+    from playfile_cli.task_builder.builder import TaskWriter
+
     console = Console()
 
     try:
@@ -115,16 +118,22 @@ def create_task(
             playfile_yaml = writer.write_task(task_config)
 
         # Success
-        console.print("[bold green]✓ Task created successfully![/bold green]")
-        console.print()
-        console.print("[bold]File updated:[/bold]")
-        console.print(f"  [green]✓[/green] {playfile_yaml.relative_to(project_root)}")
-        console.print()
-        console.print("[bold]Try it:[/bold]")
-        console.print(f'  [cyan]pf run {task_config.id} --prompt "your request"[/cyan]')
-        console.print()
-        console.print("[dim]Tip: Run 'pf list' to see all tasks[/dim]")
-        console.print()
+        console.print(
+            "\n".join(
+                [
+                    "[bold green]✓ Task created successfully![/bold green]",
+                    "",
+                    "[bold]File updated:[/bold]",
+                    f"  [green]✓[/green] {playfile_yaml.relative_to(project_root)}",
+                    "",
+                    "[bold]Try it:[/bold]",
+                    f'  [cyan]pf run {task_config.id} --prompt "your request"[/cyan]',
+                    "",
+                    "[dim]Tip: Run 'pf list' to see all tasks[/dim]",
+                    "",
+                ]
+            )
+        )
 
     except FileNotFoundError as e:
         console.print(f"[bold red]✗ Error:[/bold red] {e}")
@@ -140,5 +149,8 @@ def create_task(
         raise click.Abort from e
     except Exception as e:
         console.print(f"[bold red]✗ Unexpected error:[/bold red] {e}")
-        console.print_exception()
+        if os.environ.get("PLAYFILE_DEBUG") == "1":
+            console.print_exception()
+        else:
+            console.print("[dim]Set PLAYFILE_DEBUG=1 for traceback[/dim]")
         raise click.Abort from e
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
+import os
 from pathlib import Path
 
 import rich_click as click
@@ -10,8 +10,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from playfile_cli.tool_builder.builder import ToolBuilder, ToolConfig, ToolWriter
-
 
 @click.command(name="tool")
 @click.argument("tool_id", required=False)
@@ -73,6 +71,28 @@ def create_tool(
     """
     console = Console()
 
+    # Determine mode: Manual (has --args or both tool_id and binary) vs AI (free-form instructions)
+    is_manual_mode = args is not None or (tool_id and binary and not instructions)
+
+    # Validate arguments before loading the tool builder
+    if is_manual_mode and (not tool_id or not binary):
+        console.print("[bold red]✗ Error:[/bold red] Manual mode requires both TOOL_ID and BINARY")
+        console.print(
+            "\n[dim]Usage: pf create tool <id> <binary> [--args ...] [--timeout ...][/dim]"
+        )
+        console.print("[dim]   Or: pf create tool <instructions...> (for AI mode)[/dim]")
+        raise click.Abort
+    if not is_manual_mode and not tool_id and not instructions:
+        console.print("[bold red]✗ Error:[/bold red] AI mode requires instructions")
+        console.print("\n[dim]Usage: pf create tool <instructions...>[/dim]")
+        console.print('[dim]Example: pf create tool bash "Safe bash commands"[/dim]')
+        raise click.Abort
+
+    # Deferred so the Claude SDK is only loaded when a tool is actually created
+    import asyncio
+
+    from playfile_cli.tool_builder.builder import ToolBuilder, ToolConfig, ToolWriter
+
     try:
         # Get project root first
         if config_path:
@@ -80,17 +100,8 @@ def create_tool(
         else:
             project_root = Path.cwd()
 
-        # Determine mode: Manual (has --args or both tool_id and binary) vs AI (free-form instructions)
-        is_manual_mode = args is not None or (tool_id and binary and not instructions)
-
         if is_manual_mode:
             # Manual Mode: Quick tool addition with explicit config
-            if not tool_id or not binary:
-                console.print("[bold red]✗ Error:[/bold red] Manual mode requires both TOOL_ID and BINARY")
-                console.print("\n[dim]Usage: pf create tool <id> <binary> [--args ...] [--timeout ...]")
-                console.print("   Or: pf create tool <instructions...> (for AI mode)[/dim]")
-                raise click.Abort
-
             # Parse args
             args_list = None
             if args:
@@ -127,22 +138,10 @@ def create_tool(
 
         else:
             # AI Mode: Use Claude to intelligently design tools
-            if not tool_id and not instructions:
-                console.print("[bold red]✗ Error:[/bold red] AI mode requires instructions")
-                console.print("\n[dim]Usage: pf create tool <instructions...>")
-                console.print('Example: pf create tool bash "Safe bash commands"[/dim]')
-                raise click.Abort
-
             # Combine all arguments as instructions
-            all_instructions = []
-            if tool_id:
-                all_instructions.append(tool_id)
-            if binary:
-                all_instructions.append(binary)
-            if instructions:
-                all_instructions.extend(instructions)
-
-            user_instructions = " ".join(all_instructions)
+            user_instructions = " ".join(
+                part for part in (tool_id, binary, *instructions) if part
+            )
 
             # Show what we're doing
             console.print()
@@ -198,17 +197,25 @@ def create_tool(
             console.print()
 
         # Success
-        console.print("[bold green]✓ Tool created successfully![/bold green]" if is_manual_mode else "[bold green]✓ Tools created successfully![/bold green]")
-        console.print()
-        console.print("[bold]File updated:[/bold]")
-        console.print(f"  [green]✓[/green] {tools_yaml.relative_to(project_root)}")
-        console.print()
-        console.print("[bold]Next steps:[/bold]")
-        console.print(f"  1. Review configuration: [cyan]{tools_yaml.relative_to(project_root)}[/cyan]")
-        console.print(f"  2. Add to agent tools: [cyan]commands: ['{tool_configs[0].id}'][/cyan]")
-        console.print()
-        console.print("[dim]Tip: Run 'pf list --tools' to see all tools[/dim]")
-        console.print()
+        title = "Tool" if is_manual_mode else "Tools"
+        tools_yaml_display = tools_yaml.relative_to(project_root)
+        console.print(
+            "\n".join(
+                [
+                    f"[bold green]✓ {title} created successfully![/bold green]",
+                    "",
+                    "[bold]File updated:[/bold]",
+                    f"  [green]✓[/green] {tools_yaml_display}",
+                    "",
+                    "[bold]Next steps:[/bold]",
+                    f"  1. Review configuration: [cyan]{tools_yaml_display}[/cyan]",
+                    f"  2. Add to agent tools: [cyan]commands: ['{tool_configs[0].id}'][/cyan]",
+                    "",
+                    "[dim]Tip: Run 'pf list --tools' to see all tools[/dim]",
+                    "",
+                ]
+            )
+        )
 
     except FileNotFoundError as e:
         console.print(f"[bold red]✗ Error:[/bold red] {e}")
@@ -224,5 +231,8 @@ def create_tool(
         raise click.Abort from e
     except Exception as e:
         console.print(f"[bold red]✗ Unexpected error:[/bold red] {e}")
-        console.print_exception()
+        if os.environ.get("PLAYFILE_DEBUG") == "1":
+            console.print_exception()
+        else:
+            console.print("[dim]Set PLAYFILE_DEBUG=1 for traceback[/dim]")
         raise click.Abort from e
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import rich_click as click
@@ -9,8 +10,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from playfile_cli.templates import TemplateManager
-
 
 @click.command()
 @click.option(
@@ -47,10 +46,15 @@ def init(path: Path, force: bool, intelligent: bool) -> None:
     To create a new project from scratch, use:
       pf setup "Your project description"
     """
+    # Deferred so other commands don't load the template content
+    from playfile_cli.templates import TemplateManager
+
     console = Console()
 
     try:
         target_dir = path.resolve()
+        # Every reported file lives under target_dir, so trim the prefix instead of relative_to
+        prefix_len = len(str(target_dir).rstrip(os.sep)) + 1
 
         console.print()
         console.print(
@@ -75,7 +79,7 @@ def init(path: Path, force: bool, intelligent: bool) -> None:
             table.add_column("File", style="green")
 
             for file_path in created:
-                rel_path = file_path.relative_to(target_dir)
+                rel_path = str(file_path)[prefix_len:]
                 table.add_row(f"  {rel_path}")
 
             console.print(table)
@@ -91,7 +95,7 @@ def init(path: Path, force: bool, intelligent: bool) -> None:
             table.add_column("File", style="yellow")
 
             for file_path in skipped:
-                rel_path = file_path.relative_to(target_dir)
+                rel_path = str(file_path)[prefix_len:]
                 table.add_row(f"  {rel_path}")
 
             console.print(table)
@@ -122,18 +126,22 @@ def init(path: Path, force: bool, intelligent: bool) -> None:
 
         # Success message with next steps
         if created:
-            console.print("[bold green]✓ Project initialized successfully![/bold green]")
-            console.print()
+            lines = ["[bold green]✓ Project initialized successfully![/bold green]", ""]
             if not intelligent:
-                console.print("[bold]Next steps:[/bold]")
-                console.print("  1. Review and customize [cyan]playfile.yaml[/cyan]")
-                console.print("  2. Edit agent instructions in [cyan].play/agents/[/cyan]")
-                console.print("  3. Configure tools in [cyan].play/tools.yaml[/cyan]")
-                console.print()
-            console.print("[bold]Try it out:[/bold]")
-            console.print("  [cyan]pf list[/cyan]                    # List available tasks")
-            console.print("  [cyan]pf run code --prompt \"...\"[/cyan]  # Run a task")
-            console.print()
+                lines += [
+                    "[bold]Next steps:[/bold]",
+                    "  1. Review and customize [cyan]playfile.yaml[/cyan]",
+                    "  2. Edit agent instructions in [cyan].play/agents/[/cyan]",
+                    "  3. Configure tools in [cyan].play/tools.yaml[/cyan]",
+                    "",
+                ]
+            lines += [
+                "[bold]Try it out:[/bold]",
+                "  [cyan]pf list[/cyan]                    # List available tasks",
+                "  [cyan]pf run code --prompt \"...\"[/cyan]  # Run a task",
+                "",
+            ]
+            console.print("\n".join(lines))
         else:
             console.print(
                 "[bold yellow]⚠ No files were created (all files already exist)[/bold yellow]"
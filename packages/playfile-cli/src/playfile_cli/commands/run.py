@@ -11,7 +11,6 @@ from rich.prompt import Prompt
 
 from playfile_cli.config_loader import ConfigLoader
 from playfile_cli.input_reader import InputReader
-from playfile_cli.task_runner import TaskRunner
 
 
 @click.command()
@@ -47,6 +46,9 @@ def run(
       pf run write-code  # Interactive mode
       cat file.txt | pf run analyze --prompt -
     """
+    # Deferred so the Claude SDK is only loaded when a task is actually run
+    from playfile_cli.task_runner import TaskRunner
+
     console = Console()
 
     try:
@@ -172,7 +172,7 @@ class TaskRunner:
                     self._console.print(f"[dim]Context from: {', '.join(context_from)}[/dim]")
                 else:
                     # Show all previous steps
-                    num_artifacts = len(artifacts._artifacts)
+                    num_artifacts = len(artifacts)
                     self._console.print(f"[dim]Context: {num_artifacts} previous step(s)[/dim]")
 
             if files:
@@ -28,10 +28,17 @@ class FileWriter(Protocol):
 class StandardFileWriter:
     """Standard file system writer implementation."""
 
+    def __init__(self) -> None:
+        """Initialize writer with no directories created yet."""
+        self._ensured_dirs: set[Path] = set()
+
     def write(self, path: Path, content: str) -> None:
         """Write content to file, creating parent directories if needed."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        parent = path.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+        path.write_bytes(content.encode("utf-8"))
 
     def exists(self, path: Path) -> bool:
         """Check if file exists."""
@@ -101,7 +108,7 @@ class ProjectInitializer:
         for template in template_set.templates:
             file_path = base_path / template.relative_path
 
-            if self._file_writer.exists(file_path) and not overwrite:
+            if not overwrite and self._file_writer.exists(file_path):
                 skipped.append(file_path)
                 continue
 
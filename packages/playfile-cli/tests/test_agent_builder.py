@@ -0,0 +1,75 @@
+"""Tests for agent builder response scanning."""
+
+import json
+
+from playfile_cli.agent_builder.builder import _AgentJsonScanner
+
+AGENT_DATA = {
+    "agent": {
+        "id": "reviewer",
+        "role": "Code Reviewer",
+        "model": "claude-sonnet-4-20250514",
+        "instructions_file": ".play/agents/reviewer.md",
+        "tools": {"mode": "whitelist", "commands": ["git", "cat"]},
+        "limits": {"runtime": "5m", "iterations": 20},
+    },
+    "instructions_content": '# Reviewer\n\nUse {braces} and "quotes" \\ freely.',
+}
+AGENT_JSON = json.dumps(AGENT_DATA)
+
+
+def feed_chunks(chunks):
+    """Feed chunks to a fresh scanner and return the first result."""
+    scanner = _AgentJsonScanner()
+    for chunk in chunks:
+        data = scanner.feed(chunk)
+        if data is not None:
+            return data
+    return None
+
+
+class TestAgentJsonScanner:
+    def test_fenced_object_in_one_chunk(self):
+        """Test a fenced agent object is returned from a single chunk."""
+        text = f"Here is the agent:\n```json\n{AGENT_JSON}\n```\nDone."
+
+        assert feed_chunks([text]) == AGENT_DATA
+
+    def test_chunk_splits(self):
+        """Test the object is found however the stream is split."""
+        text = f"Here is the agent:\n```json\n{AGENT_JSON}\n```\n"
+
+        for size in (1, 2, 3, 5, 7, 64):
+            chunks = [text[i : i + size] for i in range(0, len(text), size)]
+            assert feed_chunks(chunks) == AGENT_DATA
+
+    def test_braces_and_escapes_inside_strings(self):
+        """Test braces and escaped quotes inside JSON strings don't end the object."""
+        data = feed_chunks([f"```json\n{AGENT_JSON}\n```"])
+
+        assert data is not None
+        assert data["instructions_content"] == AGENT_DATA["instructions_content"]
+
+    def test_stray_brace_in_prose(self):
+        """Test an unbalanced brace before the fence is ignored."""
+        text = f"Use a dict like {{ for config.\n```json\n{AGENT_JSON}\n```"
+
+        assert feed_chunks([text]) == AGENT_DATA
+
+    def test_example_object_before_answer(self):
+        """Test an example object in prose doesn't shadow the fenced answer."""
+        example = json.dumps({"agent": {"id": "example"}, "instructions_content": "..."})
+        text = f"For example {example} is the shape.\n```json\n{AGENT_JSON}\n```"
+
+        assert feed_chunks([text]) == AGENT_DATA
+
+    def test_incomplete_fenced_object_is_skipped(self):
+        """Test a fenced object missing AgentConfig fields doesn't stop the scan."""
+        example = json.dumps({"agent": {"id": "example"}, "instructions_content": "..."})
+        text = f"```json\n{example}\n```\nActual answer:\n```json\n{AGENT_JSON}\n```"
+
+        assert feed_chunks([text]) == AGENT_DATA
+
+    def test_unfenced_object_is_left_to_fallback(self):
+        """Test bare JSON is not returned early, leaving it to the full-content parse."""
+        assert feed_chunks([AGENT_JSON]) is None
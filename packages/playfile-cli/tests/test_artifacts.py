@@ -0,0 +1,39 @@
+"""Tests for artifact collection."""
+
+from playfile_cli.artifacts import ArtifactCollector, StepArtifact
+
+
+def make_artifact(step_number, step_id, summary):
+    """Create an artifact for a step."""
+    return StepArtifact(
+        step_number=step_number,
+        step_id=step_id,
+        agent_id="coder",
+        agent_role="Coder",
+        summary=summary,
+    )
+
+
+class TestArtifactCollector:
+    def test_duplicate_step_ids_keep_every_step(self):
+        """Test steps sharing an ID are all kept in the unfiltered context."""
+        artifacts = ArtifactCollector()
+        artifacts.add_artifact(make_artifact(1, "build", "first build"))
+        artifacts.add_artifact(make_artifact(2, None, "no id"))
+        artifacts.add_artifact(make_artifact(3, "build", "second build"))
+
+        context = artifacts.get_context_for_next_step()
+
+        assert len(artifacts) == 3
+        assert context.index("first build") < context.index("no id") < context.index("second build")
+
+    def test_context_from_uses_latest_step_for_an_id(self):
+        """Test filtering by a repeated step ID selects its latest step."""
+        artifacts = ArtifactCollector()
+        artifacts.add_artifact(make_artifact(1, "build", "first build"))
+        artifacts.add_artifact(make_artifact(2, "build", "second build"))
+
+        context = artifacts.get_context_for_next_step(["build", "missing"])
+
+        assert "second build" in context
+        assert "first build" not in context
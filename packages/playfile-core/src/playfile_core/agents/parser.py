@@ -11,6 +11,7 @@ from dacite.exceptions import DaciteError
 
 from playfile_core.agents.agent_config import AgentsConfig
 from playfile_core.exceptions import ParseError, ValidationError
+from playfile_core.yaml_io import load_yaml
 
 
 class AgentsConfigParser:
@@ -37,7 +38,7 @@ class AgentsConfigParser:
             ValidationError: If validation fails
         """
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             if not isinstance(data, dict):
                 msg = "YAML content must be a dictionary"
                 raise ParseError(msg)
@@ -201,7 +202,7 @@ class YAMLAgentLoader:
     def load(content: str) -> dict[str, Any]:
         """Load YAML content."""
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             if not isinstance(data, dict):
                 msg = "YAML content must be a dictionary"
                 raise ParseError(msg)
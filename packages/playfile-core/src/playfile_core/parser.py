@@ -18,6 +18,7 @@ from playfile_core.tools.agent_tools import AgentTools
 from playfile_core.tools.parser import AgentToolsParser
 from playfile_core.workflows.parser import WorkflowParser
 from playfile_core.workflows.workflow import Workflow
+from playfile_core.yaml_io import dump_yaml, load_yaml
 
 
 class YamlAgentConfigParser:
@@ -54,7 +55,7 @@ class YamlAgentConfigParser:
             ValidationError: If validation fails
         """
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             if not isinstance(data, dict):
                 msg = "YAML content must be a dictionary"
                 raise ParseError(msg)
@@ -186,7 +187,7 @@ class YamlAgentConfigParser:
 
             try:
                 import_content = import_file.read_text(encoding="utf-8")
-                import_data = yaml.safe_load(import_content)
+                import_data = load_yaml(import_content)
 
                 if not isinstance(import_data, dict):
                     msg = f"Import file must contain a dictionary: {import_file}"
@@ -240,7 +241,7 @@ class YamlAgentConfigParser:
         """
         # Convert back to YAML string for existing parser
         if "tools" in data or "version" in data:
-            yaml_str = yaml.dump(data)
+            yaml_str = dump_yaml(data)
             return self._tools_parser.parse(yaml_str)
         return None
 
@@ -306,5 +307,5 @@ class YamlAgentConfigParser:
         if not data.get("tasks"):
             return None
 
-        yaml_str = yaml.dump(data)
+        yaml_str = dump_yaml(data)
         return self._workflow_parser.parse(yaml_str)
@@ -12,6 +12,7 @@ from dacite.exceptions import DaciteError
 from playfile_core.exceptions import ParseError, ValidationError
 from playfile_core.tools.agent_tools import AgentTools
 from playfile_core.tools.command import ArgsMode
+from playfile_core.yaml_io import load_yaml
 
 
 class AgentToolsParser:
@@ -38,7 +39,7 @@ class AgentToolsParser:
             ValidationError: If validation fails
         """
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             if not isinstance(data, dict):
                 msg = "YAML content must be a dictionary"
                 raise ParseError(msg)
@@ -135,7 +136,7 @@ class YAMLLoader:
     def load(content: str) -> dict[str, Any]:
         """Load YAML content."""
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             if not isinstance(data, dict):
                 msg = "YAML content must be a dictionary"
                 raise ParseError(msg)
@@ -12,6 +12,7 @@ from playfile_core.exceptions import ParseError, ValidationError
 from playfile_core.workflows.agent_step import AgentInvocation, AgentStep
 from playfile_core.workflows.task import Task
 from playfile_core.workflows.workflow import Workflow
+from playfile_core.yaml_io import load_yaml
 
 
 class YAMLWorkflowLoader:
@@ -21,7 +22,7 @@ class YAMLWorkflowLoader:
     def load(content: str) -> dict[str, Any]:
         """Load YAML content and return as dictionary."""
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             if not isinstance(data, dict):
                 msg = "YAML content must be a dictionary"
                 raise ParseError(msg)
@@ -0,0 +1,41 @@
+"""YAML load/dump helpers backed by LibYAML when available."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CDumper as _Dumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import Dumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def load_yaml(content: str) -> Any:  # noqa: ANN401 - same untyped result as yaml.safe_load
+    """Safely parse YAML content, equivalent to yaml.safe_load.
+
+    Args:
+        content: YAML string content
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    return yaml.load(content, Loader=_SafeLoader)
+
+
+def dump_yaml(data: object) -> str:
+    """Serialize data to YAML, equivalent to yaml.dump.
+
+    Args:
+        data: Python object to serialize
+
+    Returns:
+        YAML string
+    """
+    return yaml.dump(data, Dumper=_Dumper)